@@ -1,3 +1,3 @@
-from .clients import s3_client
+from .clients import close_s3_client, get_s3_client
 
-__all__ = ["s3_client"]
+__all__ = ["close_s3_client", "get_s3_client"]
@@ -1,13 +1,66 @@
-import boto3
+import asyncio
+from contextlib import AsyncExitStack
+from functools import lru_cache
 
 from src.core.settings import settings
 
-s3_client = boto3.client(
-    "s3",
-    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-    region_name=settings.AWS_REGION,
-)
+_s3_client = None
+_s3_client_stack = AsyncExitStack()
+_s3_client_lock = asyncio.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_s3_session():
+    """
+    Builds the aioboto3 session on first use.
+    aioboto3 pulls in the whole botocore service model machinery, so it is imported here rather than at module level
+    to keep worker start-up cheap for requests that never reach S3.
+    """
+
+    import aioboto3
+
+    return aioboto3.Session(
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        region_name=settings.AWS_REGION,
+    )
+
+
+async def get_s3_client():
+    """
+    Returns the shared async S3 client, opening it on first use.
+    The client keeps its aiohttp connection pool open across uploads until close_s3_client() is called.
+    """
+
+    global _s3_client
+
+    # Only the first call has to open the client; later uploads skip the lock.
+    if _s3_client is not None:
+        return _s3_client
+
+    async with _s3_client_lock:
+        if _s3_client is None:
+            from aiobotocore.config import AioConfig
+
+            # Sized above the multipart transfer concurrency so parallel part uploads don't evict and re-handshake
+            # connections.
+            client_config = AioConfig(max_pool_connections=64, retries={"max_attempts": 10, "mode": "adaptive"})
+            _s3_client = await _s3_client_stack.enter_async_context(
+                _get_s3_session().client("s3", config=client_config)
+            )
+
+    return _s3_client
+
+
+async def close_s3_client() -> None:
+    """Closes the shared S3 client (and its aiohttp session) if it was ever opened."""
+
+    global _s3_client
+
+    async with _s3_client_lock:
+        await _s3_client_stack.aclose()
+        _s3_client = None
+
 
 # bedrock_client = boto3.client(
 #     aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
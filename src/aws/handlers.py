@@ -1,41 +1,76 @@
 import asyncio
-from concurrent import futures
-from io import BytesIO
+from io import SEEK_END, BytesIO
 from typing import Tuple
 
 from botocore.exceptions import BotoCoreError, ClientError
 from loguru import logger
 
-from src.aws.clients import s3_client
+from src.aws.clients import get_s3_client
 from src.core.constants import CONTENT_TYPES
 
+_MULTIPART_THRESHOLD = 16 * 1024 * 1024
+_MULTIPART_CHUNKSIZE = 64 * 1024 * 1024
+_MULTIPART_CONCURRENCY = 16
 
-def sync_upload_bytes_to_s3(bucket: str, s3_key: str, file_bytes: BytesIO, file_format: str) -> Tuple[str, bool]:
+
+async def _upload_multipart_to_s3(
+    s3_client, bucket: str, s3_key: str, file_bytes: BytesIO, size: int, content_type: str
+) -> None:
     """
-    Uploads a BytesIO object to S3.
+    Uploads a BytesIO object to S3 as a multipart upload with parts sent concurrently.
+    Each part is copied out of the buffer only once its upload slot is free, so at most
+    _MULTIPART_CONCURRENCY parts are held in memory. The upload is aborted if any part fails
+    or the upload is cancelled.
 
+    :param s3_client: Async S3 client.
     :param bucket: S3 bucket name.
     :param s3_key: Destination file name in S3.
     :param file_bytes: File content in BytesIO.
-    :param file_format: Target file format (used for MIME type).
-    :return: Tuple (status message, success flag).
+    :param size: Size of the file content in bytes.
+    :param content_type: MIME type stored on the object.
     """
 
-    content_type = CONTENT_TYPES.get(file_format, "application/octet-stream")
+    upload = await s3_client.create_multipart_upload(Bucket=bucket, Key=s3_key, ContentType=content_type)
+    upload_id = upload["UploadId"]
+    semaphore = asyncio.Semaphore(_MULTIPART_CONCURRENCY)
 
     try:
-        file_bytes.seek(0)
-        s3_client.upload_fileobj(file_bytes, bucket, s3_key, ExtraArgs={"ContentType": content_type})
-        logger.info(f"File {s3_key} uploaded to S3")
-        return "Uploaded", True
+        with file_bytes.getbuffer() as view:
 
-    except (BotoCoreError, ClientError) as e:
-        logger.error(f"Failed to upload file to S3: {str(e)}")
-        return "Error while uploading", False
+            async def _upload_part(part_number: int, offset: int) -> dict:
+                async with semaphore:
+                    part = await s3_client.upload_part(
+                        Bucket=bucket,
+                        Key=s3_key,
+                        UploadId=upload_id,
+                        PartNumber=part_number,
+                        Body=view[offset : offset + _MULTIPART_CHUNKSIZE].tobytes(),
+                    )
+                return {"ETag": part["ETag"], "PartNumber": part_number}
 
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        return "Unexpected error", False
+            offsets = range(0, size, _MULTIPART_CHUNKSIZE)
+            parts = await asyncio.gather(
+                *(_upload_part(part_number, offset) for part_number, offset in enumerate(offsets, start=1)),
+                return_exceptions=True,
+            )
+
+        for part in parts:
+            if isinstance(part, BaseException):
+                raise part
+
+        await s3_client.complete_multipart_upload(
+            Bucket=bucket, Key=s3_key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+        )
+
+    except BaseException:
+        # BaseException so a cancelled request (CancelledError) aborts too; stored parts of an upload that is never
+        # completed or aborted stay billed.
+        try:
+            await s3_client.abort_multipart_upload(Bucket=bucket, Key=s3_key, UploadId=upload_id)
+        except Exception:
+            # A failed abort must not replace the error that ended the upload.
+            logger.opt(exception=True).warning("Failed to abort multipart upload {} of {}", upload_id, s3_key)
+        raise
 
 
 async def upload_bytes_to_s3(bucket: str, s3_key: str, file_bytes: BytesIO, file_format: str) -> Tuple[str, bool]:
@@ -49,8 +84,27 @@ async def upload_bytes_to_s3(bucket: str, s3_key: str, file_bytes: BytesIO, file
     :return: Tuple (status message, success flag).
     """
 
-    loop = asyncio.get_event_loop()
-    with futures.ThreadPoolExecutor() as pool:
-        result = await loop.run_in_executor(pool, sync_upload_bytes_to_s3, bucket, s3_key, file_bytes, file_format)
+    content_type = CONTENT_TYPES.get(file_format, "application/octet-stream")
+
+    try:
+        size = file_bytes.seek(0, SEEK_END)
+        file_bytes.seek(0)
+
+        s3_client = await get_s3_client()
+        if size < _MULTIPART_THRESHOLD:
+            # Small payloads go out as one PutObject built from the in-memory buffer.
+            await s3_client.put_object(
+                Bucket=bucket, Key=s3_key, Body=file_bytes.getvalue(), ContentType=content_type, ContentLength=size
+            )
+        else:
+            await _upload_multipart_to_s3(s3_client, bucket, s3_key, file_bytes, size, content_type)
+        logger.info("File {} uploaded to S3", s3_key)
+        return "Uploaded", True
+
+    except (BotoCoreError, ClientError) as e:
+        logger.error("Failed to upload file to S3: {}", e)
+        return "Error while uploading", False
 
-    return result
+    except Exception as e:
+        logger.opt(exception=True).error("Unexpected error: {}", e)
+        return "Unexpected error", False
@@ -1,3 +1,3 @@
-from .clients import get_ocr_client
+from .clients import close_ocr_client, get_ocr_client
 
-__all__ = ["get_ocr_client"]
+__all__ = ["close_ocr_client", "get_ocr_client"]
@@ -1,11 +1,27 @@
-from azure.ai.formrecognizer import DocumentAnalysisClient
-from azure.core.credentials import AzureKeyCredential
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from src.core.settings import settings
 
+if TYPE_CHECKING:
+    from azure.ai.formrecognizer.aio import DocumentAnalysisClient
+
+
+@lru_cache(maxsize=1)
+def get_ocr_client() -> "DocumentAnalysisClient":
+    # The Form Recognizer SDK is imported on first use so workers that never hit OCR don't pay for it at start-up.
+    from azure.ai.formrecognizer.aio import DocumentAnalysisClient
+    from azure.core.credentials import AzureKeyCredential
 
-def get_ocr_client() -> DocumentAnalysisClient:
     return DocumentAnalysisClient(
         endpoint=settings.AZURE_OCR_ENDPOINT,
         credential=AzureKeyCredential(settings.AZURE_OCR_SECRET_KEY),
     )
+
+
+async def close_ocr_client() -> None:
+    """Closes the shared OCR client (and its aiohttp session) if it was ever created."""
+
+    if get_ocr_client.cache_info().currsize:
+        await get_ocr_client().close()
+        get_ocr_client.cache_clear()
@@ -1,18 +1,18 @@
-import io
+from typing import BinaryIO
 
 from loguru import logger
 
 from src.azure.clients import get_ocr_client
 
 
-async def extract_text_file_bytes(file_bytes: bytes | io.BytesIO) -> str:
+async def extract_text_file_bytes(file_bytes: bytes | BinaryIO) -> str:
     """
     Extract text from PDF bytes using Azure OCR.
-    This function takes a BytesIO object containing PDF data,
+    This function takes a binary file object containing PDF data,
     processes it with Azure's OCR service, and returns the extracted text.
 
     Parameters:
-        file_bytes (bytes | io.BytesIO): BytesIO object to read PDF data from.
+        file_bytes (bytes | BinaryIO): Binary file object to read PDF data from.
 
     Returns:
         str: Extracted text from the PDF.
@@ -21,21 +21,21 @@ async def extract_text_file_bytes(file_bytes: bytes | io.BytesIO) -> str:
     try:
         client = get_ocr_client()
 
-        file_stream = file_bytes
-        file_stream.seek(0)
+        if not isinstance(file_bytes, bytes):
+            file_bytes.seek(0)
 
-        logger.info("Starting OCR analysis on bytes...")
-        poller = client.begin_analyze_document("prebuilt-read", document=file_stream)
-        result = poller.result()
+        logger.debug("Starting OCR analysis on bytes...")
+        poller = await client.begin_analyze_document("prebuilt-read", document=file_bytes)
+        result = await poller.result()
+        if not result.pages:
+            logger.debug("OCR analysis returned no pages")
+            return ""
 
-        extracted_text = []
-        for page in result.pages:
-            for line in page.lines:
-                extracted_text.append(line.content)
+        extracted_text = " ".join(line.content for page in result.pages for line in page.lines)
 
-        logger.info("Finished OCR analysis...")
-        return " ".join(extracted_text)
+        logger.debug("Finished OCR analysis...")
+        return extracted_text
 
     except Exception as e:
-        logger.error(f"Error extracting text from PDF bytes: {e}", exc_info=True)
+        logger.opt(exception=True).error("Error extracting text from PDF bytes: {}", e)
         return ""
@@ -0,0 +1,31 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from src.core.settings import settings
+
+
+@lru_cache(maxsize=1)
+def get_pdf_process_pool() -> ProcessPoolExecutor:
+    """
+    Returns the shared process pool used for parallel PDF page extraction, starting it on first use.
+    PyMuPDF is not thread-safe, so pages are extracted in separate processes rather than threads. Workers are spawned
+    instead of forked because the server process already runs threads (event loop executors, aiohttp).
+    """
+
+    return ProcessPoolExecutor(
+        max_workers=settings.PDF_PARALLEL_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def shutdown_pdf_process_pool(wait: bool = True) -> None:
+    """
+    Stops the PDF process pool workers if the pool was ever started, so the next get_pdf_process_pool() call starts
+    a fresh one. Called with wait=False once a worker died (e.g. a MuPDF crash or an OOM kill), since a broken pool
+    rejects every later submission.
+    """
+
+    if get_pdf_process_pool.cache_info().currsize:
+        get_pdf_process_pool().shutdown(wait=wait, cancel_futures=True)
+        get_pdf_process_pool.cache_clear()
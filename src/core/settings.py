@@ -1,3 +1,5 @@
+import os
+
 from pydantic_settings import BaseSettings
 from decouple import config
 
@@ -21,7 +23,25 @@ class _AzureOCRSettings(BaseSettings):
     AZURE_OCR_SECRET_KEY: str = config("AZURE_OCR_SECRET_KEY")
 
 
-class _AppSettings(_AWSS3Settings, _AWSBedrockSettings, _AzureOCRSettings): ...
+class _ExtractionCacheSettings(BaseSettings):
+    EXTRACTION_CACHE_SIZE: int = config("EXTRACTION_CACHE_SIZE", 256, cast=int)
+    EXTRACTION_CACHE_MAX_BYTES: int = config("EXTRACTION_CACHE_MAX_BYTES", 64 * 1024 * 1024, cast=int)
+    EXTRACTION_CACHE_MAX_ENTRY_BYTES: int = config("EXTRACTION_CACHE_MAX_ENTRY_BYTES", 4 * 1024 * 1024, cast=int)
+
+
+class _PDFExtractionSettings(BaseSettings):
+    PDF_PARALLEL_WORKERS: int = config("PDF_PARALLEL_WORKERS", min(4, os.cpu_count() or 1), cast=int)
+    PDF_PARALLEL_MIN_PAGES: int = config("PDF_PARALLEL_MIN_PAGES", 64, cast=int)
+    PDF_PARALLEL_MAX_TRANSFER_BYTES: int = config("PDF_PARALLEL_MAX_TRANSFER_BYTES", 256 * 1024 * 1024, cast=int)
+
+
+class _AppSettings(
+    _AWSS3Settings,
+    _AWSBedrockSettings,
+    _AzureOCRSettings,
+    _ExtractionCacheSettings,
+    _PDFExtractionSettings,
+): ...
 
 
 settings = _AppSettings()
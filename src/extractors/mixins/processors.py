@@ -1,4 +1,4 @@
-import io
+from typing import BinaryIO
 
 from loguru import logger
 
@@ -6,20 +6,20 @@ from src.azure.handlers import extract_text_file_bytes
 
 
 class ProcessorMixin:
-    async def _use_ocr_text_extraction(self, file_bytes: bytes | io.BytesIO) -> tuple[str, bool]:
+    async def _use_ocr_text_extraction(self, file_bytes: bytes | BinaryIO) -> tuple[str, bool]:
         """Sends the PDF bytes to Azure OCR for text extraction."""
 
         try:
-            logger.info(f"Starting OCR text extraction from file")
+            logger.debug("Starting OCR text extraction from file")
 
             ocr_extracted_text = await extract_text_file_bytes(file_bytes)
-            if (ocr_extracted_text and ocr_extracted_text.strip() == "") or not ocr_extracted_text:
+            if not ocr_extracted_text or ocr_extracted_text.isspace():
                 logger.info("Could not extract text via OCR or file is empty.")
                 return "Could not extract text via OCR or file is empty.", False
 
-            logger.info(f"OCR text extracted successfully")
+            logger.debug("OCR text extracted successfully")
             return ocr_extracted_text, True
 
         except Exception as e:
-            logger.error(f"Unexpected error during OCR text extraction: {str(e)}")
-            return "", False
+            logger.error("Unexpected error during OCR text extraction: {}", e)
+            return "Failed to extract text via OCR.", False
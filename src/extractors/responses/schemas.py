@@ -19,8 +19,13 @@ def builder_file_content_extraction_response(
     success: bool, reason: str = "", filename: str = "", content_type: str = "", content: str = ""
 ) -> FileContentExtractionResponse:
 
+    # Every value comes from the extraction service, already typed, so validation is skipped with model_construct().
     file_info = None
     if filename and content_type:
-        file_info = FileResponseSchema(filename=filename, content_type=content_type, content=content if success else "")
+        file_info = FileResponseSchema.model_construct(
+            filename=filename, content_type=content_type, content=content if success else ""
+        )
 
-    return FileContentExtractionResponse(success=success, reason=reason if not success else "", file=file_info)
+    return FileContentExtractionResponse.model_construct(
+        success=success, reason=reason if not success else "", file=file_info
+    )
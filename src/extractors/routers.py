@@ -1,8 +1,6 @@
-from io import BytesIO
-
 from fastapi import APIRouter, UploadFile
+from fastapi.responses import ORJSONResponse
 from starlette import status
-from starlette.responses import JSONResponse
 
 from src.extractors.responses.schemas import builder_file_content_extraction_response
 from src.extractors.services import get_file_content_extractor
@@ -14,11 +12,8 @@ router = APIRouter()
 async def scrape_file_content(
     file: UploadFile,
 ):
-    file_content = await file.read()
-    file_bytes = BytesIO(file_content)
-
     service = get_file_content_extractor()
-    result = await service.extract_file_content(file.filename, file_bytes, file.content_type)
+    result = await service.extract_file_content(file.filename, file.file, file.content_type)
 
     response_schema = builder_file_content_extraction_response(
         success=result.success,
@@ -28,4 +23,4 @@ async def scrape_file_content(
         content=result.file.content,
     ).model_dump()
 
-    return JSONResponse(status_code=result.http_status, content=response_schema)
+    return ORJSONResponse(status_code=result.http_status, content=response_schema)
@@ -0,0 +1,75 @@
+import asyncio
+import hashlib
+import sys
+from collections import OrderedDict
+
+from src.core.settings import settings
+from src.extractors.services.schemas import ProcessedFileSchema
+
+# Hashing releases the GIL but still blocks the event loop, so larger payloads are hashed in a worker thread.
+_INLINE_HASH_LIMIT = 1024 * 1024
+
+# Accessed only from the event loop thread and never across an await, so no lock is needed.
+_PROCESSED_FILES: OrderedDict[tuple[str, bytes], ProcessedFileSchema] = OrderedDict()
+_cached_bytes = 0
+
+
+async def content_key(kind: str, payload: bytes) -> tuple[str, bytes] | None:
+    """
+    Returns the cache key of a payload: its kind (e.g. "pdf") and the SHA-256 digest of its content.
+    Returns None without hashing the payload when the cache is disabled (EXTRACTION_CACHE_SIZE <= 0).
+    """
+
+    if settings.EXTRACTION_CACHE_SIZE <= 0:
+        return None
+
+    if len(payload) < _INLINE_HASH_LIMIT:
+        return kind, hashlib.sha256(payload).digest()
+
+    digest = await asyncio.to_thread(hashlib.sha256, payload)
+    return kind, digest.digest()
+
+
+def get_cached_result(key: tuple[str, bytes] | None) -> ProcessedFileSchema | None:
+    """
+    Returns the result previously stored for the key and marks it as recently used.
+    Returns None on a miss or for a None key (the cache is disabled).
+    """
+
+    if key is None:
+        return None
+
+    result = _PROCESSED_FILES.get(key)
+    if result is not None:
+        _PROCESSED_FILES.move_to_end(key)
+
+    return result
+
+
+def cache_result(key: tuple[str, bytes] | None, result: ProcessedFileSchema) -> None:
+    """
+    Stores a successful processing result, evicting least recently used entries while the cache holds more than
+    EXTRACTION_CACHE_SIZE entries or more than EXTRACTION_CACHE_MAX_BYTES of extracted text.
+    Texts above EXTRACTION_CACHE_MAX_ENTRY_BYTES are not cached, so one huge document can't flush the whole cache.
+    Failed results are not cached so transient errors (e.g. an OCR outage) are retried on the next upload.
+    Nothing is stored for a None key (the cache is disabled).
+    """
+
+    global _cached_bytes
+
+    if key is None or not result.processed or settings.EXTRACTION_CACHE_SIZE <= 0:
+        return
+
+    size = sys.getsizeof(result.text)
+    if size > settings.EXTRACTION_CACHE_MAX_ENTRY_BYTES or size > settings.EXTRACTION_CACHE_MAX_BYTES:
+        return
+
+    previous = _PROCESSED_FILES.pop(key, None)
+    if previous is not None:
+        _cached_bytes -= sys.getsizeof(previous.text)
+
+    _PROCESSED_FILES[key] = result
+    _cached_bytes += size
+    while len(_PROCESSED_FILES) > settings.EXTRACTION_CACHE_SIZE or _cached_bytes > settings.EXTRACTION_CACHE_MAX_BYTES:
+        _, evicted = _PROCESSED_FILES.popitem(last=False)
+        _cached_bytes -= sys.getsizeof(evicted.text)
@@ -1,22 +1,26 @@
-import io
-from typing import Callable
+from functools import lru_cache
+from types import MappingProxyType
+from typing import BinaryIO, Callable, Mapping
 
 from loguru import logger
 
 from src.extractors.services.processors import GlobalProcessor
 from src.extractors.services.schemas import FileContentExtractSchema, FileInfoSchema, ProcessedFileSchema
+from src.extractors.utils import get_file_size
 
 
 class _FileContentExtractor(GlobalProcessor):
-    def __init__(self):
-        self.PROCESSOR_BY_CONTENT_TYPES: dict[str, Callable] = {
-            "application/pdf": self.process_pdf_bytes,
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document": self.process_docx_bytes,
-            "text/plain": self.process_txt_bytes,
+    # Unbound processor functions, resolved once at class creation and called with the instance on dispatch.
+    PROCESSOR_BY_CONTENT_TYPES: Mapping[str, Callable] = MappingProxyType(
+        {
+            "application/pdf": GlobalProcessor.process_pdf_bytes,
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document": GlobalProcessor.process_docx_bytes,
+            "text/plain": GlobalProcessor.process_txt_bytes,
         }
+    )
 
     async def extract_file_content(
-        self, filename: str, file_bytes: bytes | io.BytesIO, content_type: str
+        self, filename: str, file_bytes: bytes | BinaryIO, content_type: str
     ) -> FileContentExtractSchema:
         """
         Extract text content from a file based on its type.
@@ -24,7 +28,7 @@ class _FileContentExtractor(GlobalProcessor):
 
         Parameters:
             filename: str - The name of the file.
-            file_bytes: bytes or io.BytesIO - The file content in bytes or BytesIO format.
+            file_bytes: bytes or BinaryIO - The file content in bytes or as a binary file object.
             content_type: str - The MIME type of the file (e.g., 'application/pdf').
 
         Returns:
@@ -39,7 +43,7 @@ class _FileContentExtractor(GlobalProcessor):
         """
 
         try:
-            if not file_bytes:
+            if not file_bytes or not get_file_size(file_bytes):
                 logger.info("Missed file bytes")
                 return self._build_response(
                     success=False,
@@ -51,7 +55,7 @@ class _FileContentExtractor(GlobalProcessor):
                 )
 
             elif content_type not in self.PROCESSOR_BY_CONTENT_TYPES:
-                logger.info(f"Unsupported content type: {content_type}")
+                logger.info("Unsupported content type: {}", content_type)
                 return self._build_response(
                     success=False,
                     http_status=400,
@@ -72,7 +76,7 @@ class _FileContentExtractor(GlobalProcessor):
             )
 
         except (KeyError, Exception) as e:
-            logger.error(str(e))
+            logger.error("Unexpected error during file content extraction: {}", e)
             return self._build_response(
                 success=False,
                 http_status=500,
@@ -87,7 +91,7 @@ class _FileContentExtractor(GlobalProcessor):
         success: bool,
         result: str,
         filename: str,
-        file_bytes: bytes | io.BytesIO,
+        file_bytes: bytes | BinaryIO,
         content_type: str,
         http_status: int = 200,
     ) -> FileContentExtractSchema:
@@ -98,7 +102,7 @@ class _FileContentExtractor(GlobalProcessor):
             success: bool - Indicates if the extraction was successful.
             result: str - The extracted content or reason for failure.
             filename: str - The name of the file.
-            file_bytes: bytes or io.BytesIO - The file content in bytes or BytesIO format.
+            file_bytes: bytes or BinaryIO - The file content in bytes or as a binary file object.
             content_type: str - The MIME type of the file.
         """
 
@@ -111,13 +115,13 @@ class _FileContentExtractor(GlobalProcessor):
             ),
         )
 
-    async def _process_file_bytes(self, file_bytes: bytes | io.BytesIO, content_type: str) -> ProcessedFileSchema:
+    async def _process_file_bytes(self, file_bytes: bytes | BinaryIO, content_type: str) -> ProcessedFileSchema:
         """
         Process the file bytes based on the content type.
         This method checks the content type and applies the appropriate processing method.
 
         Parameters:
-            file_bytes: bytes or io.BytesIO - The file content in bytes or BytesIO format.
+            file_bytes: bytes or BinaryIO - The file content in bytes or as a binary file object.
             content_type: str - The MIME type of the file (e.g., 'application/pdf').
 
         Returns:
@@ -131,20 +135,21 @@ class _FileContentExtractor(GlobalProcessor):
         try:
             file_bytes.seek(0)
 
-            if self.PROCESSOR_BY_CONTENT_TYPES.get(content_type, None):
-                processor = self.PROCESSOR_BY_CONTENT_TYPES[content_type]
-                processed_file: ProcessedFileSchema = await processor(file_bytes)
+            processor = self.PROCESSOR_BY_CONTENT_TYPES.get(content_type)
+            if processor:
+                processed_file: ProcessedFileSchema = await processor(self, file_bytes)
 
                 return processed_file
 
             return ProcessedFileSchema(processed=False, http_status=400, reason="Unsupported file type")
 
         except Exception as e:
-            logger.error(f"Unexpected error during file processing: {str(e)}")
+            logger.error("Unexpected error during file processing: {}", e)
             return ProcessedFileSchema(
                 processed=False, http_status=500, reason="Unexpected error during file processing"
             )
 
 
+@lru_cache(maxsize=1)
 def get_file_content_extractor() -> _FileContentExtractor:
     return _FileContentExtractor()
@@ -7,4 +7,4 @@ class GlobalProcessor(DocxProcessor, PDFProcessor, TXTProcessor):
     pass
 
 
-__all__ = ["GlobalProcessor", "PDFProcessor", "TXTProcessor", "PDFProcessor"]
+__all__ = ["GlobalProcessor", "DocxProcessor", "PDFProcessor", "TXTProcessor"]
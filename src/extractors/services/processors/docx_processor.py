@@ -1,22 +1,60 @@
 import asyncio
 import io
+from typing import TYPE_CHECKING, BinaryIO
 
-from docx import Document
-from docx.document import Document as DocumentObject
 from loguru import logger
 
 from src.extractors.mixins.processors import ProcessorMixin
 from src.extractors.services.schemas import ProcessedFileSchema
 
+if TYPE_CHECKING:
+    from docx.document import Document as DocumentObject
+    from docx.oxml.text.paragraph import CT_P
+
+# Clark-notation tags spelled out instead of built with docx.oxml.ns.qn, which would import the whole python-docx
+# package (and lxml's oxml registrations) as soon as this module is loaded.
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_P = f"{_W_NS}p"
+_W_R = f"{_W_NS}r"
+_W_HYPERLINK = f"{_W_NS}hyperlink"
+_W_T = f"{_W_NS}t"
+_W_BR = f"{_W_NS}br"
+_W_BR_TYPE = f"{_W_NS}type"
+_RUN_SYMBOLS = {f"{_W_NS}tab": "\t", f"{_W_NS}ptab": "\t", f"{_W_NS}cr": "\n", f"{_W_NS}noBreakHyphen": "-"}
+
+
+def _paragraph_text(paragraph: "CT_P") -> str:
+    """
+    Collect the text of a `w:p` element without building python-docx Paragraph and Run proxy objects.
+    Mirrors python-docx's `Paragraph.text`: only the paragraph's direct `w:r` children and the runs of its
+    `w:hyperlink` children are read, and only the direct text children of each run (tabs, line breaks, non-breaking
+    hyphens). Nested content such as text boxes (written twice, under `mc:Choice` and `mc:Fallback`) and tracked moves
+    is skipped the same way.
+    """
+
+    parts = []
+    for child in paragraph.iterchildren(_W_R, _W_HYPERLINK):
+        runs = (child,) if child.tag == _W_R else child.iterchildren(_W_R)
+        for run in runs:
+            for node in run.iterchildren(_W_T, _W_BR, *_RUN_SYMBOLS):
+                if node.tag == _W_T:
+                    parts.append(node.text or "")
+                elif node.tag == _W_BR:
+                    parts.append("\n" if node.get(_W_BR_TYPE, "textWrapping") == "textWrapping" else "")
+                else:
+                    parts.append(_RUN_SYMBOLS[node.tag])
+
+    return "".join(parts)
+
 
 class DocxProcessor(ProcessorMixin):
-    async def process_docx_bytes(self, file_bytes: bytes | io.BytesIO) -> ProcessedFileSchema:
+    async def process_docx_bytes(self, file_bytes: bytes | BinaryIO) -> ProcessedFileSchema:
         """
         Process DOCX file bytes to extract text content.
         Uses base text extraction from python-docx library.
 
         Parameters:
-            file_bytes: bytes or io.BytesIO - The PDF file content in bytes or BytesIO format.
+            file_bytes: bytes or BinaryIO - The DOCX file content in bytes or as a binary file object.
 
         Returns:
             ProcessedFileSchema - The result of the processing, including success status and extracted text or
@@ -27,14 +65,13 @@ class DocxProcessor(ProcessorMixin):
                 - ProcessedFileSchema(processed=False, http_status=422, reason="Failed to extract text from the file")
         """
 
-        logger.info("Starting DOCX file processing")
+        logger.debug("Starting DOCX file processing")
 
         if not file_bytes:
             logger.info("Missed file bytes")
             return ProcessedFileSchema(processed=False, http_status=500, reason="Missed file bytes")
 
-        document = Document(file_bytes)
-        extracted_file_content, processed = await self._use_base_docx_text_extraction(document)
+        extracted_file_content, processed = await asyncio.to_thread(self._use_base_docx_text_extraction, file_bytes)
 
         if not processed:
             logger.info("Failed to extract text from the file")
@@ -42,44 +79,47 @@ class DocxProcessor(ProcessorMixin):
 
         return ProcessedFileSchema(processed=processed, http_status=201, text=extracted_file_content)
 
-    async def _use_base_docx_text_extraction(self, document: DocumentObject) -> tuple[str, bool]:
+    def _use_base_docx_text_extraction(self, file_bytes: bytes | BinaryIO) -> tuple[str, bool]:
         """
         Extract text from DOCX using python-docx library.
-        This method reads the DOCX file bytes and extracts text from all paragraphs.
+        This method parses the DOCX file bytes and extracts text from all paragraphs.
+        It is synchronous and CPU-bound, so callers run it in a worker thread to keep the event loop free.
         If text extraction is successful, it returns the concatenated text from all paragraphs.
-        If any error occurs during the process, it logs the error and returns an empty string with a failure status.
+        If any error occurs during the process (including a file that can't be parsed as DOCX), it logs the error and
+        returns a failure reason with a failure status.
 
         Parameters:
-            document: DocumentObject - The DOCX document object.
+            file_bytes: bytes or BinaryIO - The DOCX file content in bytes or as a binary file object.
 
         Returns:
-            tuple[str, bool] - A tuple containing the extracted text (or an empty string if extraction failed)
+            tuple[str, bool] - A tuple containing the extracted text (or the failure reason if extraction failed)
             and a boolean indicating success (True) or failure (False).
 
             **Examples:**
                 - ("Extracted text from DOCX", True)
-                - ("", False)
+                - ("Failed to extract text from the DOCX file.", False)
         """
 
-        def _decode() -> str:
-            return " ".join([para.text for para in document.paragraphs])
+        from docx import Document
 
         try:
-            logger.info(f"Starting text extraction from DOCX file")
+            logger.debug("Starting text extraction from DOCX file")
 
-            text = await asyncio.to_thread(_decode)
-            if not text.strip():
+            # File objects (the spooled upload) are parsed in place so large uploads aren't loaded into memory whole.
+            document = Document(io.BytesIO(file_bytes) if isinstance(file_bytes, bytes) else file_bytes)
+            text = " ".join(_paragraph_text(paragraph) for paragraph in document.element.body.iterchildren(_W_P))
+            if not text or text.isspace():
                 return "Could not extract text or file is empty.", False
 
-            logger.info(f"Text extracted successfully")
+            logger.debug("Text extracted successfully")
             return text, True
 
         except Exception as e:
-            logger.error(f"Error during DOCX text extraction: {e}")
-            return "", False
+            logger.error("Error during DOCX text extraction: {}", e)
+            return "Failed to extract text from the DOCX file.", False
 
     async def _use_combine_docx_text_extraction(
-        self, document: DocumentObject, file_bytes: bytes | io.BytesIO
+        self, document: "DocumentObject", file_bytes: bytes | BinaryIO
     ) -> tuple[str, bool]:
         """
         Combine base text extraction and OCR for DOCX files.
@@ -89,7 +129,7 @@ class DocxProcessor(ProcessorMixin):
 
         Parameters:
             document: DocumentObject - The DOCX document object.
-            file_bytes: bytes or io.BytesIO - The file content in bytes or BytesIO format.
+            file_bytes: bytes or BinaryIO - The file content in bytes or as a binary file object.
 
         Returns:
             tuple[str, bool] - A tuple containing the extracted text (or an empty string if extraction failed)
@@ -1,23 +1,26 @@
 import asyncio
-import io
+from concurrent.futures.process import BrokenProcessPool
+from typing import BinaryIO
 
-import fitz
 from loguru import logger
 
+from src.core.executors import get_pdf_process_pool, shutdown_pdf_process_pool
+from src.core.settings import settings
 from src.extractors.mixins.processors import ProcessorMixin
+from src.extractors.services.cache import cache_result, content_key, get_cached_result
 from src.extractors.services.schemas import ProcessedFileSchema
-from src.extractors.utils import extract_first_page_text_from_pdf_bytes
+from src.extractors.utils import extract_pdf_pages_text, extract_pdf_text_layer, read_payload
 
 
 class PDFProcessor(ProcessorMixin):
-    async def process_pdf_bytes(self, file_bytes: bytes | io.BytesIO) -> ProcessedFileSchema:
+    async def process_pdf_bytes(self, file_bytes: bytes | BinaryIO) -> ProcessedFileSchema:
         """
         Process PDF file bytes to extract text content.
         Uses base text extraction if text is found on the first page, otherwise uses OCR for pages with images.
         For base text extraction, PyMuPDF (fitz) is used and for OCR, Azure Cognitive Services is intended.
 
         Parameters:
-            file_bytes: bytes or io.BytesIO - The PDF file content in bytes or BytesIO format.
+            file_bytes: bytes or BinaryIO - The PDF file content in bytes or as a binary file object.
 
         Returns:
             ProcessedFileSchema - The result of the processing, including success status and extracted text or
@@ -28,68 +31,148 @@ class PDFProcessor(ProcessorMixin):
                 - ProcessedFileSchema(processed=False, http_status=422, reason="Failed to extract text from the file")
         """
 
-        logger.info("Starting PDF file processing")
+        logger.debug("Starting PDF file processing")
 
         if not file_bytes:
             logger.info("Missed file bytes")
             return ProcessedFileSchema(processed=False, reason="Missed file bytes")
 
-        first_page_text = await asyncio.to_thread(extract_first_page_text_from_pdf_bytes, file_bytes)
-
-        extracted_file_content, processed = "", False
-        if first_page_text:
-            logger.info("First page text extracted successfully, using base text extraction")
-            extracted_file_content, processed = await self._use_base_pdf_text_extraction(file_bytes)
-
-        elif not first_page_text:
+        # fitz gets immutable bytes and every document is opened and closed inside one worker-thread call, so a
+        # cancelled request can't free memory or close a document that MuPDF is still reading.
+        payload = await read_payload(file_bytes)
+        cache_key = await content_key("pdf", payload)
+        cached_result = get_cached_result(cache_key)
+        if cached_result is not None:
+            logger.debug("Returning cached PDF processing result")
+            return cached_result
+
+        workers = self._get_parallel_workers(len(payload))
+        parallel_min_pages = settings.PDF_PARALLEL_MIN_PAGES if workers > 1 else None
+        page_texts, page_count = await asyncio.to_thread(extract_pdf_text_layer, payload, parallel_min_pages)
+
+        first_page_text = page_texts[0] if page_texts else ""
+        if first_page_text and not first_page_text.isspace():
+            logger.debug("First page text extracted successfully, using base text extraction")
+            extracted_file_content, processed = await self._use_base_pdf_text_extraction(
+                payload, page_texts, page_count, workers
+            )
+
+        else:
             logger.info("No text found on the first page, using OCR text extraction")
-            extracted_file_content, processed = await self._use_ocr_text_extraction(file_bytes)
+            extracted_file_content, processed = await self._use_ocr_text_extraction(payload)
 
         if not processed:
             logger.info("Failed to extract text from the file")
             return ProcessedFileSchema(processed=processed, http_status=422, reason=extracted_file_content)
 
-        return ProcessedFileSchema(processed=processed, http_status=201, text=extracted_file_content)
+        result = ProcessedFileSchema(processed=processed, http_status=201, text=extracted_file_content)
+        cache_result(cache_key, result)
+        return result
 
-    async def _use_base_pdf_text_extraction(self, file_bytes: bytes | io.BytesIO) -> tuple[str, bool]:
+    async def _use_base_pdf_text_extraction(
+        self, payload: bytes, page_texts: list[str], page_count: int, workers: int
+    ) -> tuple[str, bool]:
         """
         Extract text from PDF using PyMuPDF (fitz) library.
-        This method reads the PDF file bytes and extracts text from all pages.
+        This method completes the page texts already extracted with the first page probe and joins all pages.
+        Documents with at least PDF_PARALLEL_MIN_PAGES pages are split into page ranges extracted in worker processes.
         If text extraction is successful, it returns the concatenated text from all pages.
-        If any error occurs during the process, it logs the error and returns an empty string with a failure status.
+        If any error occurs during the process, it logs the error and returns a failure reason with a failure status.
 
         Parameters:
-            file_bytes: bytes or io.BytesIO - The PDF file content in bytes or BytesIO format.
+            payload: bytes - The PDF file content.
+            page_texts: list[str] - The texts of the leading pages already extracted, starting with the first page.
+            page_count: int - The number of pages in the document.
+            workers: int - The number of worker processes to split the remaining pages across.
 
         Returns:
-            tuple[str, bool] - A tuple containing the extracted text (or an empty string if extraction failed)
+            tuple[str, bool] - A tuple containing the extracted text (or the failure reason if extraction failed)
             and a boolean indicating success (True) or failure (False).
 
             **Examples:**
                 - ("Extracted text from PDF", True)
-                - ("", False)
+                - ("Failed to extract text from the PDF file.", False)
         """
 
-        def _decode() -> str:
-            doc = fitz.open("pdf", file_bytes.read())
-
-            pages_text = ""
-            for page in doc.pages():
-                text = page.get_text()
-                pages_text += f" {text}"
-
-            return pages_text
-
         try:
-            logger.info(f"Starting text extraction from PDF file")
+            logger.debug("Starting text extraction from PDF file")
+
+            if len(page_texts) < page_count:
+                page_texts = page_texts + await self._extract_pages_text_in_parallel(
+                    payload, len(page_texts), page_count, workers
+                )
 
-            text = await asyncio.to_thread(_decode)
-            if not text.strip():
+            text = " ".join(page_texts)
+            if not text or text.isspace():
                 return "Could not extract text or file is empty.", False
 
-            logger.info(f"Text extracted successfully")
+            logger.debug("Text extracted successfully")
             return text, True
 
         except Exception as e:
-            logger.error(f"Unexpected error during base text extraction: {str(e)}")
-            return "", False
+            logger.error("Unexpected error during base text extraction: {}", e)
+            return "Failed to extract text from the PDF file.", False
+
+    @staticmethod
+    def _get_parallel_workers(payload_size: int) -> int:
+        """
+        Get the number of worker processes a PDF of the given size is split across.
+        Every page range sends the whole payload to its worker, so the fan-out is capped to keep the bytes pickled
+        per document within PDF_PARALLEL_MAX_TRANSFER_BYTES. A result of 1 means the PDF is extracted sequentially.
+
+        Parameters:
+            payload_size: int - The size of the PDF file content in bytes.
+
+        Returns:
+            int - The number of workers, between 1 and PDF_PARALLEL_WORKERS.
+
+            **Examples:**
+                - 4 (a 10 MiB PDF with the default settings)
+                - 1 (a PDF larger than PDF_PARALLEL_MAX_TRANSFER_BYTES)
+        """
+
+        transfer_limit = settings.PDF_PARALLEL_MAX_TRANSFER_BYTES // max(payload_size, 1)
+        return max(1, min(settings.PDF_PARALLEL_WORKERS, transfer_limit))
+
+    async def _extract_pages_text_in_parallel(
+        self, payload: bytes, start: int, page_count: int, workers: int
+    ) -> list[str]:
+        """
+        Extract the text of pages start..page_count - 1 in the PDF process pool.
+        The pages are split into one contiguous range per worker; every worker opens its own copy of the document.
+        A pool broken by a dead worker is replaced and the extraction retried once in the new pool; the pages are never
+        extracted in-process, since the document may be what crashed the worker.
+
+        Parameters:
+            payload: bytes - The PDF file content.
+            start: int - The first page to extract.
+            page_count: int - The number of pages in the document.
+            workers: int - The number of page ranges to split the pages into.
+
+        Returns:
+            list[str] - The texts of the extracted pages, in page order.
+        """
+
+        step = -(-(page_count - start) // workers)
+
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            pool = get_pdf_process_pool()
+            try:
+                ranges = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            pool, extract_pdf_pages_text, payload, range_start, min(range_start + step, page_count)
+                        )
+                        for range_start in range(start, page_count, step)
+                    )
+                )
+                return [text for range_texts in ranges for text in range_texts]
+
+            except BrokenProcessPool:
+                logger.warning("PDF process pool is broken, starting a new one (attempt {})", attempt + 1)
+                # Another request may have replaced the pool already; only drop the one that broke.
+                if get_pdf_process_pool() is pool:
+                    shutdown_pdf_process_pool(wait=False)
+
+        raise RuntimeError("PDF page extraction workers crashed")
@@ -1,49 +1,39 @@
-import io
-from typing import Union, Optional, Any
+from dataclasses import dataclass
+from typing import BinaryIO, Optional
 
-from pydantic import BaseModel, model_validator
 
-
-class FileInfoSchema(BaseModel):
+# Internal DTOs passed between the service and the router; they never go through FastAPI request parsing or response
+# serialization, so plain slotted dataclasses are used instead of pydantic models.
+@dataclass(slots=True, frozen=True, kw_only=True)
+class FileInfoSchema:
     filename: str
     content_type: str
-    file_bytes: Union[bytes, io.BytesIO]
+    file_bytes: bytes | BinaryIO
     content: Optional[str] = ""
 
-    class Config:
-        arbitrary_types_allowed = True
-
 
-class FileContentExtractSchema(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class FileContentExtractSchema:
     success: bool
     http_status: Optional[int] = 200
     reason: Optional[str] = ""
     file: FileInfoSchema
 
-    class Config:
-        arbitrary_types_allowed = True
-
 
-class ProcessedFileSchema(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ProcessedFileSchema:
     processed: bool
     http_status: Optional[int] = 200
     reason: Optional[str] = ""
     text: Optional[str] = ""
 
-    @model_validator(mode="before")
-    def check_processed_dependencies(cls, values: dict[str, Any]) -> dict[str, Any]:
+    def __post_init__(self) -> None:
         """
         Validates that 'text' is present if 'processed' is True,
         and 'reason' is present if 'processed' is False.
         """
 
-        processed = values.get("processed")
-        text = values.get("text")
-        reason = values.get("reason")
-
-        if processed and not text:
+        if self.processed and not self.text:
             raise ValueError("text field is required when processing is successful")
-        if not processed and not reason:
+        if not self.processed and not self.reason:
             raise ValueError("reason field is required when processing fails")
-
-        return values
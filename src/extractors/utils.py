@@ -1,15 +1,113 @@
+import asyncio
 import io
+import re
+from typing import BinaryIO
 
 import fitz
 
+# PyMuPDF plain-text extraction flags. Ligature and whitespace preservation are dropped since all page text is
+# flattened into a single string, so ligatures are expanded and whitespace is normalised; TEXT_CID_FOR_UNKNOWN_UNICODE
+# is kept so glyphs of subset fonts without a ToUnicode map come back as their character codes instead of U+FFFD.
+# Leaving out TEXT_MEDIABOX_CLIP changes nothing: get_text("text") still cuts text that runs past the page edge.
+_PDF_TEXT_FLAGS = fitz.TEXT_CID_FOR_UNKNOWN_UNICODE
 
-def extract_first_page_text_from_pdf_bytes(file_bytes: bytes | io.BytesIO) -> str:
-    """Extract text from the first page of a PDF file given as bytes or a BytesIO object."""
+# PDF text-showing operators (Tj, TJ, ' and "). Binary inline image data can match too, which only costs a regular
+# text extraction.
+_PDF_TEXT_OPERATORS = re.compile(rb"T[jJ]|['\"]")
 
-    doc = fitz.open(stream=file_bytes, filetype="pdf")
-    if doc.page_count < 1:
-        return ""
-    page = doc.load_page(0)
-    text = page.get_text()
 
-    return text.strip()
+def get_file_size(file_bytes: bytes | BinaryIO) -> int:
+    """Return the size of the file content without reading it; file objects are left rewound to the start."""
+
+    if isinstance(file_bytes, bytes):
+        return len(file_bytes)
+
+    size = file_bytes.seek(0, io.SEEK_END)
+    file_bytes.seek(0)
+    return size
+
+
+def _pdf_page_may_have_text(page: fitz.Page) -> bool:
+    """
+    Check whether a PDF page can contain extractable text without running MuPDF's text extraction.
+    Form XObjects and annotations carry content streams of their own, so pages with them are always treated as maybe.
+    """
+
+    if page.get_xobjects() or page.first_annot or page.first_widget:
+        return True
+
+    return _PDF_TEXT_OPERATORS.search(page.read_contents()) is not None
+
+
+def extract_pdf_text_layer(payload: bytes, parallel_min_pages: int | None = None) -> tuple[list[str], int]:
+    """
+    Open a PDF payload and extract the text of its pages in page order, closing the document before returning.
+    The whole document lifetime stays inside this call, so a caller running it in a worker thread never has to close
+    (or free the memory of) a document that is still being read. Returns the extracted page texts and the page count.
+    Extraction stops after the first page when it has no text (the caller falls back to OCR), or when the document has
+    at least `parallel_min_pages` pages so the caller can extract the remaining pages in the process pool.
+    Pages whose content stream has no text operators at all (typical scans) are answered with an empty string without
+    running the text extraction.
+    """
+
+    with fitz.open(stream=payload, filetype="pdf") as doc:
+        page_count = doc.page_count
+        if not page_count:
+            return [], 0
+
+        page = doc.load_page(0)
+        first_page_text = (
+            page.get_text("text", flags=_PDF_TEXT_FLAGS, sort=False) if _pdf_page_may_have_text(page) else ""
+        )
+        if not first_page_text or first_page_text.isspace():
+            return [first_page_text], page_count
+
+        if parallel_min_pages is not None and page_count >= parallel_min_pages:
+            return [first_page_text], page_count
+
+        # Collect the pages and join once; growing a str with += re-copies the whole text for every page.
+        page_texts = [first_page_text]
+        page_texts_append = page_texts.append
+        for page_number in range(1, page_count):
+            page_texts_append(doc.load_page(page_number).get_text("text", flags=_PDF_TEXT_FLAGS, sort=False))
+
+    return page_texts, page_count
+
+
+def read_file_bytes(file_bytes: bytes | BinaryIO) -> bytes:
+    """
+    Return the whole file content as immutable bytes.
+    BytesIO buffers are returned without moving their cursor, other file objects are rewound and read from the start.
+    """
+
+    if isinstance(file_bytes, bytes):
+        return file_bytes
+
+    if isinstance(file_bytes, io.BytesIO):
+        return file_bytes.getvalue()
+
+    file_bytes.seek(0)
+    return file_bytes.read()
+
+
+async def read_payload(file_bytes: bytes | BinaryIO) -> bytes:
+    """
+    Return the whole file content as immutable bytes without blocking the event loop.
+    Bytes and BytesIO buffers are already in memory and returned inline. Other file objects (uploads above Starlette's
+    spool threshold live on disk) are read in a worker thread.
+    """
+
+    if isinstance(file_bytes, (bytes, io.BytesIO)):
+        return read_file_bytes(file_bytes)
+
+    return await asyncio.to_thread(read_file_bytes, file_bytes)
+
+
+def extract_pdf_pages_text(payload: bytes, start: int, stop: int) -> list[str]:
+    """
+    Open a PDF payload and return the text of the pages in the [start, stop) range.
+    Used by the parallel extraction workers, each of which opens its own copy of the document.
+    """
+
+    with fitz.open(stream=payload, filetype="pdf") as doc:
+        return [doc.load_page(n).get_text("text", flags=_PDF_TEXT_FLAGS, sort=False) for n in range(start, stop)]
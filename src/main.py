@@ -2,22 +2,31 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, APIRouter
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from loguru import logger
-from starlette.responses import JSONResponse
 from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY
 
+from src.aws import close_s3_client
+from src.azure import close_ocr_client
+from src.core.executors import shutdown_pdf_process_pool
 from src.extractors.routers import router as extractor_router
 
-app = FastAPI()
-
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     """Lifespan event handler for the FastAPI application."""
-    logger.info(f"Lifespan: starting...")
+    logger.info("Lifespan: starting...")
 
     yield
 
+    logger.info("Lifespan: shutting down...")
+    await close_ocr_client()
+    await close_s3_client()
+    shutdown_pdf_process_pool()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
 
 api_v1_router = APIRouter(prefix="/api/v1")
 api_v1_router.include_router(extractor_router, tags=["Text Extractor"])
@@ -27,7 +36,7 @@ app.include_router(api_v1_router, tags=["v1"])
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(_request, exc):
     errors = [{"field": err["loc"][-1], "msg": err["msg"]} for err in exc.errors()]
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=HTTP_422_UNPROCESSABLE_ENTITY,
         content={"detail": errors},
     )
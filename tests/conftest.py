@@ -0,0 +1,12 @@
+import os
+
+# src.core.settings reads these at import time; the tests never talk to AWS or Azure.
+for _name, _value in {
+    "AWS_ACCESS_KEY_ID": "test",
+    "AWS_SECRET_ACCESS_KEY": "test",
+    "S3_BUCKET_NAME": "test",
+    "AWS_REGION": "us-east-1",
+    "AZURE_OCR_ENDPOINT": "https://test.cognitiveservices.azure.com/",
+    "AZURE_OCR_SECRET_KEY": "test",
+}.items():
+    os.environ.setdefault(_name, _value)
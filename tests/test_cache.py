@@ -0,0 +1,96 @@
+import asyncio
+import hashlib
+import sys
+
+import pytest
+
+from src.core.settings import settings
+from src.extractors.services import cache
+from src.extractors.services.cache import cache_result, content_key, get_cached_result
+from src.extractors.services.schemas import ProcessedFileSchema
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(cache, "_PROCESSED_FILES", type(cache._PROCESSED_FILES)())
+    monkeypatch.setattr(cache, "_cached_bytes", 0)
+    monkeypatch.setattr(settings, "EXTRACTION_CACHE_SIZE", 3)
+    monkeypatch.setattr(settings, "EXTRACTION_CACHE_MAX_BYTES", 1024 * 1024)
+    monkeypatch.setattr(settings, "EXTRACTION_CACHE_MAX_ENTRY_BYTES", 1024 * 1024)
+
+
+def _result(text: str) -> ProcessedFileSchema:
+    return ProcessedFileSchema(processed=True, http_status=201, text=text)
+
+
+def _key(name: str) -> tuple[str, bytes]:
+    return "pdf", name.encode()
+
+
+@pytest.mark.parametrize("size", [16, cache._INLINE_HASH_LIMIT], ids=["inline", "worker-thread"])
+def test_content_key_is_the_kind_and_sha256_digest(size):
+    payload = b"x" * size
+
+    assert asyncio.run(content_key("pdf", payload)) == ("pdf", hashlib.sha256(payload).digest())
+
+
+def test_disabled_cache_skips_hashing(monkeypatch):
+    monkeypatch.setattr(settings, "EXTRACTION_CACHE_SIZE", 0)
+    monkeypatch.setattr(cache.hashlib, "sha256", pytest.fail)
+
+    key = asyncio.run(content_key("pdf", b"payload"))
+    cache_result(key, _result("text"))
+
+    assert key is None
+    assert get_cached_result(key) is None
+    assert not cache._PROCESSED_FILES
+
+
+def test_least_recently_used_entry_is_evicted():
+    for name in ("a", "b", "c"):
+        cache_result(_key(name), _result(name))
+
+    assert get_cached_result(_key("a")) is not None
+    cache_result(_key("d"), _result("d"))
+
+    assert get_cached_result(_key("b")) is None
+    assert list(cache._PROCESSED_FILES) == [_key("c"), _key("a"), _key("d")]
+
+
+def test_failed_results_are_not_cached():
+    cache_result(_key("a"), ProcessedFileSchema(processed=False, http_status=422, reason="failed"))
+
+    assert get_cached_result(_key("a")) is None
+
+
+def test_cached_bytes_follow_the_stored_texts(monkeypatch):
+    text_size = sys.getsizeof("a" * 100)
+    monkeypatch.setattr(settings, "EXTRACTION_CACHE_MAX_BYTES", 2 * text_size)
+
+    for name in ("a", "b", "c"):
+        cache_result(_key(name), _result(name * 100))
+
+    assert list(cache._PROCESSED_FILES) == [_key("b"), _key("c")]
+    assert cache._cached_bytes == 2 * text_size
+
+
+def test_oversized_entry_is_not_cached(monkeypatch):
+    monkeypatch.setattr(settings, "EXTRACTION_CACHE_MAX_ENTRY_BYTES", sys.getsizeof("a" * 100))
+    cache_result(_key("a"), _result("a"))
+
+    cache_result(_key("b"), _result("b" * 101))
+
+    assert get_cached_result(_key("b")) is None
+    assert list(cache._PROCESSED_FILES) == [_key("a")]
+    assert cache._cached_bytes == sys.getsizeof("a")
+
+
+def test_reinserting_a_key_replaces_its_entry():
+    cache_result(_key("a"), _result("a" * 100))
+    cache_result(_key("b"), _result("b"))
+
+    cache_result(_key("a"), _result("a"))
+
+    assert get_cached_result(_key("a")).text == "a"
+    assert list(cache._PROCESSED_FILES) == [_key("b"), _key("a")]
+    assert cache._cached_bytes == sys.getsizeof("a") + sys.getsizeof("b")
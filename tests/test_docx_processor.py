@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.text.paragraph import Paragraph
+
+from src.extractors.services.processors.docx_processor import DocxProcessor, _paragraph_text
+
+_TEXT_BOX_RUN = """
+<w:r>
+  <mc:AlternateContent>
+    <mc:Choice Requires="wps">
+      <w:drawing><wps:txbx><w:txbxContent><w:p><w:r><w:t>BOX</w:t></w:r></w:p></w:txbxContent></wps:txbx></w:drawing>
+    </mc:Choice>
+    <mc:Fallback>
+      <w:pict><v:textbox><w:txbxContent><w:p><w:r><w:t>BOX</w:t></w:r></w:p></w:txbxContent></v:textbox></w:pict>
+    </mc:Fallback>
+  </mc:AlternateContent>
+</w:r>
+"""
+
+_NAMESPACES = (
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+    'xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape" '
+    'xmlns:v="urn:schemas-microsoft-com:vml"'
+)
+
+
+def _paragraph(body: str):
+    return parse_xml(f"<w:p {nsdecls('w')} {_NAMESPACES}>{body}</w:p>")
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        "<w:r><w:t>Body</w:t></w:r>",
+        "<w:pPr><w:tabs><w:tab w:val='left' w:pos='720'/></w:tabs></w:pPr><w:r><w:t>tab</w:t><w:tab/><w:t>stop</w:t></w:r>",
+        "<w:r><w:t>line</w:t><w:br/><w:t>break</w:t><w:br w:type='page'/><w:cr/><w:noBreakHyphen/><w:ptab/></w:r>",
+        "<w:r><w:t>see </w:t></w:r><w:hyperlink><w:r><w:t>link</w:t></w:r></w:hyperlink>",
+        f"<w:r><w:t>Body</w:t></w:r>{_TEXT_BOX_RUN}",
+        "<w:moveFrom><w:r><w:t>moved</w:t></w:r></w:moveFrom><w:moveTo><w:r><w:t>moved</w:t></w:r></w:moveTo>",
+    ],
+    ids=["plain", "tab-stops", "run-symbols", "hyperlink", "text-box", "tracked-move"],
+)
+def test_paragraph_text_matches_python_docx(body):
+    paragraph = _paragraph(body)
+
+    assert _paragraph_text(paragraph) == Paragraph(paragraph, None).text
+
+
+def test_unparsable_docx_is_rejected_with_a_reason():
+    result = asyncio.run(DocxProcessor().process_docx_bytes(b"not a docx file"))
+
+    assert not result.processed
+    assert result.http_status == 422
+    assert result.reason == "Failed to extract text from the DOCX file."
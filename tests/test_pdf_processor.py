@@ -0,0 +1,85 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from src.extractors.services.processors import pdf_processor
+from src.extractors.services.processors.pdf_processor import PDFProcessor
+
+
+class _BrokenPool:
+    def submit(self, *_args):
+        future = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        return future
+
+
+class _Pools:
+    """Stands in for the shared pool accessors; every shutdown replaces the current pool with the next one."""
+
+    def __init__(self, *pools):
+        self.pools = list(pools)
+        self.current = self.pools.pop(0)
+        self.shutdowns = []
+
+    def get(self):
+        return self.current
+
+    def shutdown(self, wait=True):
+        self.shutdowns.append(wait)
+        self.current = self.pools.pop(0)
+
+
+@pytest.fixture
+def page_ranges(monkeypatch):
+    ranges = []
+
+    def extract_pdf_pages_text(_payload, start, stop):
+        ranges.append((start, stop))
+        return [f"page {n}" for n in range(start, stop)]
+
+    monkeypatch.setattr(pdf_processor, "extract_pdf_pages_text", extract_pdf_pages_text)
+    return ranges
+
+
+def _use_pools(monkeypatch, *pools) -> _Pools:
+    accessors = _Pools(*pools)
+    monkeypatch.setattr(pdf_processor, "get_pdf_process_pool", accessors.get)
+    monkeypatch.setattr(pdf_processor, "shutdown_pdf_process_pool", accessors.shutdown)
+    return accessors
+
+
+@pytest.mark.parametrize(
+    "start, page_count, workers",
+    [(1, 64, 4), (1, 65, 4), (1, 3, 4), (1, 100, 3), (1, 2, 1), (5, 70, 8)],
+)
+def test_parallel_ranges_cover_every_page_once_in_order(monkeypatch, page_ranges, start, page_count, workers):
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        _use_pools(monkeypatch, pool)
+
+        texts = asyncio.run(PDFProcessor()._extract_pages_text_in_parallel(b"%PDF", start, page_count, workers))
+
+    assert texts == [f"page {n}" for n in range(start, page_count)]
+    assert len(page_ranges) <= workers
+    assert all(range_start < range_stop for range_start, range_stop in page_ranges)
+
+
+def test_broken_pool_is_replaced_and_retried_once(monkeypatch, page_ranges):
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        pools = _use_pools(monkeypatch, _BrokenPool(), pool)
+
+        texts = asyncio.run(PDFProcessor()._extract_pages_text_in_parallel(b"%PDF", 1, 10, 2))
+
+    assert texts == [f"page {n}" for n in range(1, 10)]
+    assert pools.shutdowns == [False]
+
+
+def test_pool_broken_twice_fails(monkeypatch, page_ranges):
+    pools = _use_pools(monkeypatch, _BrokenPool(), _BrokenPool(), _BrokenPool())
+
+    with pytest.raises(RuntimeError, match="crashed"):
+        asyncio.run(PDFProcessor()._extract_pages_text_in_parallel(b"%PDF", 1, 10, 2))
+
+    assert pools.shutdowns == [False, False]
+    assert not page_ranges
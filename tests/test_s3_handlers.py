@@ -0,0 +1,97 @@
+import asyncio
+from io import BytesIO
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.aws import handlers
+from src.aws.handlers import _upload_multipart_to_s3
+
+
+class _FakeS3Client:
+    def __init__(self, fail_part: int | None = None, hang: bool = False, fail_abort: bool = False):
+        self.fail_part = fail_part
+        self.hang = hang
+        self.fail_abort = fail_abort
+        self.parts = []
+        self.completed = None
+        self.aborted = False
+        self.parts_started = asyncio.Event()
+
+    async def create_multipart_upload(self, **_kwargs):
+        return {"UploadId": "upload-id"}
+
+    async def upload_part(self, *, UploadId, PartNumber, Body, **_kwargs):
+        assert UploadId == "upload-id"
+        self.parts_started.set()
+        if self.hang:
+            await asyncio.Event().wait()
+        if PartNumber == self.fail_part:
+            raise RuntimeError("part failed")
+
+        self.parts.append((PartNumber, Body))
+        return {"ETag": f'"etag-{PartNumber}"'}
+
+    async def complete_multipart_upload(self, *, MultipartUpload, **_kwargs):
+        self.completed = MultipartUpload["Parts"]
+
+    async def abort_multipart_upload(self, *, UploadId, **_kwargs):
+        assert UploadId == "upload-id"
+        self.aborted = True
+        if self.fail_abort:
+            raise ClientError({"Error": {"Code": "RequestTimeout"}}, "AbortMultipartUpload")
+
+
+@pytest.fixture(autouse=True)
+def small_parts(monkeypatch):
+    monkeypatch.setattr(handlers, "_MULTIPART_CHUNKSIZE", 4)
+    monkeypatch.setattr(handlers, "_MULTIPART_CONCURRENCY", 2)
+
+
+def _upload(client: _FakeS3Client, payload: bytes):
+    return _upload_multipart_to_s3(client, "bucket", "key", BytesIO(payload), len(payload), "text/plain")
+
+
+def test_parts_are_numbered_and_completed_with_their_etags():
+    client = _FakeS3Client()
+
+    asyncio.run(_upload(client, b"0123456789"))
+
+    assert sorted(client.parts) == [(1, b"0123"), (2, b"4567"), (3, b"89")]
+    assert client.completed == [{"ETag": f'"etag-{n}"', "PartNumber": n} for n in (1, 2, 3)]
+    assert not client.aborted
+
+
+def test_failed_part_aborts_the_upload():
+    client = _FakeS3Client(fail_part=2)
+
+    with pytest.raises(RuntimeError, match="part failed"):
+        asyncio.run(_upload(client, b"0123456789"))
+
+    assert client.aborted
+    assert client.completed is None
+
+
+def test_failed_abort_does_not_hide_the_part_error():
+    client = _FakeS3Client(fail_part=2, fail_abort=True)
+
+    with pytest.raises(RuntimeError, match="part failed"):
+        asyncio.run(_upload(client, b"0123456789"))
+
+    assert client.aborted
+
+
+def test_cancelled_upload_is_aborted():
+    async def cancel_while_parts_are_in_flight(client: _FakeS3Client):
+        task = asyncio.create_task(_upload(client, b"0123456789"))
+        await client.parts_started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    client = _FakeS3Client(hang=True)
+
+    asyncio.run(cancel_while_parts_are_in_flight(client))
+
+    assert client.aborted
+    assert client.completed is None